@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import sqlite3
-from typing import Iterable, List, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 
 def connect(db_path: str) -> sqlite3.Connection:
@@ -9,9 +11,59 @@ def connect(db_path: str) -> sqlite3.Connection:
     conn.execute("PRAGMA foreign_keys = ON;")
     conn.execute("PRAGMA journal_mode = WAL;")
     conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")
     return conn
 
 
+def connect_readonly(db_path: str) -> sqlite3.Connection:
+    # Read side (Part 2): larger page cache, in-memory temp b-trees for GROUP BY, mmap'd reads.
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA query_only = ON;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    return conn
+
+
+_SHARED_READONLY: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+def shared_readonly_connection(db_path: str) -> sqlite3.Connection:
+    # One connection per process: keyed on pid so a forked worker opens its own handle
+    # instead of reusing one inherited from the parent (sqlite handles are not fork-safe).
+    key = (os.getpid(), db_path)
+    conn = _SHARED_READONLY.get(key)
+    if conn is None:
+        conn = connect_readonly(db_path)
+        _SHARED_READONLY[key] = conn
+    return conn
+
+
+@contextmanager
+def read_snapshot(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    # One deferred read transaction around a batch of SELECTs: the shared lock / WAL read mark
+    # is taken once instead of per statement, and every query in the batch sees the same data.
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+
+
+def close_shared_connections() -> None:
+    pid = os.getpid()
+    for key in [k for k in _SHARED_READONLY if k[0] == pid]:
+        conn = _SHARED_READONLY.pop(key)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
 def table_exists(conn: sqlite3.Connection, table_name: str) -> bool:
     row = conn.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
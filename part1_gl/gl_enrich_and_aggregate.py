@@ -26,6 +26,35 @@ def ensure_agg_schema(conn, gl_agg_table: str) -> None:
     )
     conn.commit()
 
+def ensure_agg_indexes(conn, gl_agg_table: str) -> None:
+    # Part 2 filters every statement query by investor, then categorization/property/timeframe.
+    # Built after the bulk load so inserts/updates above don't pay for index maintenance.
+    # owner/gl_mapping_type/value ride along so the mortgage-balance, Total Invested and per-property
+    # perf aggregates are answered from the index alone.
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_{gl_agg_table}_investor_cat "
+        f"ON {gl_agg_table} (investor, categorization, property, timeframe, owner, gl_mapping_type, value);"
+    )
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_{gl_agg_table}_investor_prop_acq "
+        f"ON {gl_agg_table} (investor, property, acquired);"
+    )
+    # Cash tables and account balances filter on investor/owner/timeframe with no categorization.
+    # The trailing columns make it covering for the all-investor monthly perf aggregate, which
+    # groups by investor/owner/timeframe/categorization in index order and sums value by gl_mapping_type.
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_{gl_agg_table}_investor_owner_tf_cat "
+        f"ON {gl_agg_table} (investor, owner, timeframe, categorization, gl_mapping_type, value);"
+    )
+    # Covering index for monthly_cash_table: its GROUP BY timeframe/cash_categorization/cash_type_mapping
+    # and SUM(cash_value) are answered from the index without touching gl_agg rows.
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_{gl_agg_table}_investor_tf_cash "
+        f"ON {gl_agg_table} (investor, timeframe, cash_categorization, cash_type_mapping, owner, cash_value);"
+    )
+    conn.execute(f"ANALYZE {gl_agg_table};")
+    conn.commit()
+
 def reset_agg_table(conn, gl_agg_table: str) -> None:
     conn.execute(f"DROP TABLE IF EXISTS {gl_agg_table};")
     ensure_agg_schema(conn, gl_agg_table)
@@ -327,42 +356,41 @@ def build_aggregate_table(
         )
         conn.execute("DROP TABLE IF EXISTS _prop_map;")
 
-        # Append timeframe [T1]..[T13] based on Statement Thru Date month
-        t1_start = pd.to_datetime(statement_thru_date, errors="raise").to_period("M").to_timestamp().strftime("%Y-%m-%d")
+        # Append timeframe [T1]..[T13] based on Statement Thru Date month.
+        # d = months between the statement month and month_start, computed once per row;
+        # the statement month index is bound as a plain integer.
+        t1 = pd.to_datetime(statement_thru_date, errors="raise")
+        t1_month_index = int(t1.year) * 12 + int(t1.month)
 
         conn.execute(
             f"""
             UPDATE {gl_agg_table}
             SET timeframe = (
-                CASE
-                    -- Future months
-                    WHEN (
-                        (CAST(strftime('%Y', month_start) AS INTEGER) * 12 + CAST(strftime('%m', month_start) AS INTEGER))
-                        > (CAST(strftime('%Y', ?) AS INTEGER) * 12 + CAST(strftime('%m', ?) AS INTEGER))
-                    )
-                    THEN 'N/A'
-
-                    -- T1 to T12
-                    WHEN (
-                        (CAST(strftime('%Y', ?) AS INTEGER) * 12 + CAST(strftime('%m', ?) AS INTEGER))
-                        - (CAST(strftime('%Y', month_start) AS INTEGER) * 12 + CAST(strftime('%m', month_start) AS INTEGER))
-                    ) BETWEEN 0 AND 11
-                    THEN '[T' || (
-                        (
-                            (CAST(strftime('%Y', ?) AS INTEGER) * 12 + CAST(strftime('%m', ?) AS INTEGER))
-                            - (CAST(strftime('%Y', month_start) AS INTEGER) * 12 + CAST(strftime('%m', month_start) AS INTEGER))
-                        ) + 1
-                    ) || ']'
-
-                    -- Older than T12
-                    ELSE '[T13]'
-                END
+                SELECT
+                    CASE
+                        -- Future months
+                        WHEN d < 0 THEN 'N/A'
+
+                        -- T1 to T12
+                        WHEN d <= 11 THEN '[T' || (d + 1) || ']'
+
+                        -- Older than T12
+                        ELSE '[T13]'
+                    END
+                FROM (
+                    SELECT ? - (
+                        CAST(strftime('%Y', {gl_agg_table}.month_start) AS INTEGER) * 12
+                        + CAST(strftime('%m', {gl_agg_table}.month_start) AS INTEGER)
+                    ) AS d
+                )
             );
             """,
-            (t1_start, t1_start, t1_start, t1_start, t1_start, t1_start),
+            (t1_month_index,),
         )
 
         conn.commit()
 
+        ensure_agg_indexes(conn, gl_agg_table)
+
     finally:
         conn.close()
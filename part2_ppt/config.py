@@ -51,4 +51,17 @@ PARTIAL_OWNERSHIP_VISIBILITY_RULES = {
     "pct_owner_note": {"full": False, "partial": True},
 }
 
-EXPORT_MONTHLY_STMT_XLSX = False
\ No newline at end of file
+EXPORT_MONTHLY_STMT_XLSX = False
+
+# Per-row "Currently on N of M" lines from the monthly tables; off by default since every
+# deck prints ~26 of them. Start/end summaries per table are always printed.
+PRINT_ROW_PROGRESS = False
+
+# Per-slide "Scanning slide" and per-object "Updating object" lines from apply_object_updates;
+# off by default. The start/completed summary lines and each updater's own result line are always printed.
+PRINT_OBJECT_PROGRESS = False
+
+# Worker processes for the python-pptx update step; 1 (default) runs every deck in this process.
+# Opt in with e.g. min(4, os.cpu_count() or 1); workers print their "Saved temp updated deck"
+# lines interleaved with the combine output.
+PPT_UPDATE_WORKERS = 1
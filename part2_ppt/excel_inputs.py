@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import config
 from openpyxl import load_workbook
@@ -15,13 +17,12 @@ class GeneralConfig:
 
 
 def load_general_config(xlsx_path: Path, sheet_name: str, label_output_location: str, label_statement_thru: str) -> GeneralConfig:
-    wb = load_workbook(filename=str(xlsx_path), data_only=True)
-    if sheet_name not in wb.sheetnames:
+    label_rows = _setup_sheet_rows(xlsx_path, sheet_name)
+    if label_rows is None:
         raise ValueError(f"Missing sheet '{sheet_name}' in setup workbook.")
-    ws = wb[sheet_name]
 
-    output_location = _find_label_value(ws, label_output_location)
-    statement_thru = _find_label_value(ws, label_statement_thru)
+    output_location = _find_label_value(label_rows, label_output_location)
+    statement_thru = _find_label_value(label_rows, label_statement_thru)
 
     if output_location is None or str(output_location).strip() == "":
         raise ValueError("Could not locate Output Location value in General Config.")
@@ -31,6 +32,39 @@ def load_general_config(xlsx_path: Path, sheet_name: str, label_output_location:
     statement_thru_dt = _coerce_to_datetime(statement_thru)
     return GeneralConfig(statement_thru_date=statement_thru_dt, output_location=Path(str(output_location)))
 
+_MARKET_VALUE_LABELS = {
+    "Studio Market:": "Studio",
+    "1-Bed Market:": "1-Bed",
+    "2-Bed Market:": "2-Bed",
+    "3-Bed Market:": "3-Bed",
+}
+
+
+def load_general_config_market_values(xlsx_path: Path, sheet_name: str) -> Tuple[Tuple[str, float], ...]:
+    # Read once in main() and handed to every deck on UpdateContext, so worker processes
+    # never re-open the setup workbook. Returns (unit_type, value) in _MARKET_VALUE_LABELS order;
+    # a label repeated in the sheet takes its last value.
+    label_rows = _setup_sheet_rows(xlsx_path, sheet_name)
+    if label_rows is None:
+        raise ValueError(f"Missing sheet '{sheet_name}' in setup workbook.")
+
+    found: Dict[str, float] = {}
+
+    for row in label_rows:
+        a = row[0] if row else None
+        if a is None:
+            continue
+        unit_type = _MARKET_VALUE_LABELS.get(str(a).strip())
+        if unit_type is None:
+            continue
+        b = row[1] if len(row) > 1 else None
+        try:
+            found[unit_type] = float(b)
+        except Exception:
+            found[unit_type] = 0.0
+
+    return tuple((ut, float(found.get(ut, 0.0))) for ut in _MARKET_VALUE_LABELS.values())
+
 @dataclass(frozen=True)
 class RunConfigRow:
     investor: str
@@ -38,10 +72,9 @@ class RunConfigRow:
     standard_slides_template: str
 
 def load_run_config_rows(xlsx_path: Path, sheet_name: str) -> List[RunConfigRow]:
-    wb = load_workbook(filename=str(xlsx_path), data_only=True)
-    if sheet_name not in wb.sheetnames:
+    ws = _setup_sheet_rows(xlsx_path, sheet_name)
+    if ws is None:
         raise ValueError(f"Missing sheet '{sheet_name}' in setup workbook.")
-    ws = wb[sheet_name]
 
     header_row_idx, investor_col_idx = _find_header_cell(ws, "Investor")
     if header_row_idx is None or investor_col_idx is None:
@@ -60,11 +93,11 @@ def load_run_config_rows(xlsx_path: Path, sheet_name: str) -> List[RunConfigRow]
 
     row_idx = header_row_idx + 1
     while True:
-        investor_val = ws.cell(row=row_idx, column=investor_col_idx).value
+        investor_val = _cell_value(ws, row_idx, investor_col_idx)
         if investor_val is None or str(investor_val).strip() == "":
             break
 
-        owner_val = ws.cell(row=row_idx, column=owner_col_idx).value
+        owner_val = _cell_value(ws, row_idx, owner_col_idx)
         if owner_val is None or str(owner_val).strip() == "":
             raise ValueError(f"Run Config row {row_idx} has an Investor but missing Owner.")
 
@@ -80,7 +113,7 @@ def load_run_config_rows(xlsx_path: Path, sheet_name: str) -> List[RunConfigRow]
 
         tmpl_val = ""
         if base_template_col_idx is not None:
-            v = ws.cell(row=row_idx, column=base_template_col_idx).value
+            v = _cell_value(ws, row_idx, base_template_col_idx)
             tmpl_val = "" if v is None else str(v).strip()
 
         rows.append(
@@ -99,129 +132,166 @@ def load_run_config_rows(xlsx_path: Path, sheet_name: str) -> List[RunConfigRow]
     return rows
 
 def load_investor_table_ownership_map(xlsx_path: Path) -> Dict[Tuple[str, str], List[float]]:
-    wb = load_workbook(filename=str(xlsx_path), data_only=True)
-    try:
-        sheet_name = getattr(config, "INVESTOR_TABLE_SHEET", "Investor Table")
-        if sheet_name not in wb.sheetnames:
-            raise ValueError(f"Missing sheet '{sheet_name}' in setup workbook.")
-        ws = wb[sheet_name]
-
-        header_row_idx, investor_col_idx = _find_header_cell(ws, "Investor")
-        if header_row_idx is None or investor_col_idx is None:
-            raise ValueError("Could not find an 'Investor' header in Investor Table.")
+    sheet_name = getattr(config, "INVESTOR_TABLE_SHEET", "Investor Table")
+    ws = _setup_sheet_rows(xlsx_path, sheet_name)
+    if ws is None:
+        raise ValueError(f"Missing sheet '{sheet_name}' in setup workbook.")
 
-        _, owner_col_idx = _find_header_cell(ws, "Owner")
-        if owner_col_idx is None:
-            raise ValueError("Could not find an 'Owner' header in Investor Table.")
+    header_row_idx, investor_col_idx = _find_header_cell(ws, "Investor")
+    if header_row_idx is None or investor_col_idx is None:
+        raise ValueError("Could not find an 'Investor' header in Investor Table.")
 
-        _, property_col_idx = _find_header_cell(ws, "Property")
-        if property_col_idx is None:
-            raise ValueError("Could not find a 'Property' header in Investor Table.")
+    _, owner_col_idx = _find_header_cell(ws, "Owner")
+    if owner_col_idx is None:
+        raise ValueError("Could not find an 'Owner' header in Investor Table.")
 
-        _, ownership_col_idx = _find_header_cell(ws, "% Ownership")
-        if ownership_col_idx is None:
-            raise ValueError("Could not find a '% Ownership' header in Investor Table.")
+    _, property_col_idx = _find_header_cell(ws, "Property")
+    if property_col_idx is None:
+        raise ValueError("Could not find a 'Property' header in Investor Table.")
 
-        def _parse_pct_100_format(value: object, row_idx_local: int) -> float:
-            if value is None:
-                raise ValueError(f"Investor Table row {row_idx_local} missing % Ownership.")
+    _, ownership_col_idx = _find_header_cell(ws, "% Ownership")
+    if ownership_col_idx is None:
+        raise ValueError("Could not find a '% Ownership' header in Investor Table.")
 
-            if isinstance(value, str):
-                s = value.strip()
-                if s == "":
-                    raise ValueError(f"Investor Table row {row_idx_local} missing % Ownership.")
-                s = s.replace("%", "").strip()
-                try:
-                    v = float(s)
-                except Exception:
-                    raise ValueError(f"Investor Table row {row_idx_local} has invalid % Ownership: {value}")
-                return v
+    def _parse_pct_100_format(value: object, row_idx_local: int) -> float:
+        if value is None:
+            raise ValueError(f"Investor Table row {row_idx_local} missing % Ownership.")
 
+        if isinstance(value, str):
+            s = value.strip()
+            if s == "":
+                raise ValueError(f"Investor Table row {row_idx_local} missing % Ownership.")
+            s = s.replace("%", "").strip()
             try:
-                v_num = float(value)
+                v = float(s)
             except Exception:
                 raise ValueError(f"Investor Table row {row_idx_local} has invalid % Ownership: {value}")
+            return v
 
-            if 0.0 <= v_num <= 1.0:
-                return v_num * 100.0
+        try:
+            v_num = float(value)
+        except Exception:
+            raise ValueError(f"Investor Table row {row_idx_local} has invalid % Ownership: {value}")
 
-            return v_num
+        if 0.0 <= v_num <= 1.0:
+            return v_num * 100.0
 
-        ownership_by_inv_owner: Dict[Tuple[str, str], List[float]] = {}
-        sums_by_owner_property: Dict[Tuple[str, str], float] = {}
+        return v_num
 
-        row_idx = header_row_idx + 1
-        while True:
-            investor_val = ws.cell(row=row_idx, column=investor_col_idx).value
-            if investor_val is None or str(investor_val).strip() == "":
-                break
+    ownership_by_inv_owner: Dict[Tuple[str, str], List[float]] = {}
+    sums_by_owner_property: Dict[Tuple[str, str], float] = {}
 
-            owner_val = ws.cell(row=row_idx, column=owner_col_idx).value
-            property_val = ws.cell(row=row_idx, column=property_col_idx).value
-
-            if owner_val is None or str(owner_val).strip() == "":
-                raise ValueError(f"Investor Table row {row_idx} has an Investor but missing Owner.")
-            if property_val is None or str(property_val).strip() == "":
-                raise ValueError(f"Investor Table row {row_idx} has an Investor but missing Property.")
+    row_idx = header_row_idx + 1
+    while True:
+        investor_val = _cell_value(ws, row_idx, investor_col_idx)
+        if investor_val is None or str(investor_val).strip() == "":
+            break
 
-            investor = str(investor_val).strip()
-            owner = str(owner_val).strip()
-            prop = str(property_val).strip()
+        owner_val = _cell_value(ws, row_idx, owner_col_idx)
+        property_val = _cell_value(ws, row_idx, property_col_idx)
 
-            pct_val = ws.cell(row=row_idx, column=ownership_col_idx).value
-            pct = _parse_pct_100_format(pct_val, row_idx)
+        if owner_val is None or str(owner_val).strip() == "":
+            raise ValueError(f"Investor Table row {row_idx} has an Investor but missing Owner.")
+        if property_val is None or str(property_val).strip() == "":
+            raise ValueError(f"Investor Table row {row_idx} has an Investor but missing Property.")
 
-            if pct <= 0.0 or pct > 100.0:
-                raise ValueError(
-                    f"Investor Table row {row_idx} has % Ownership out of range: {pct}. Valid range is >0 and <=100."
-                )
+        investor = str(investor_val).strip()
+        owner = str(owner_val).strip()
+        prop = str(property_val).strip()
 
-            inv_owner_key = (investor.lower(), owner.lower())
-            if inv_owner_key not in ownership_by_inv_owner:
-                ownership_by_inv_owner[inv_owner_key] = []
-            ownership_by_inv_owner[inv_owner_key].append(float(pct))
+        pct_val = _cell_value(ws, row_idx, ownership_col_idx)
+        pct = _parse_pct_100_format(pct_val, row_idx)
 
-            owner_prop_key = (owner.lower(), prop.lower())
-            sums_by_owner_property[owner_prop_key] = sums_by_owner_property.get(owner_prop_key, 0.0) + float(pct)
+        if pct <= 0.0 or pct > 100.0:
+            raise ValueError(
+                f"Investor Table row {row_idx} has % Ownership out of range: {pct}. Valid range is >0 and <=100."
+            )
 
-            row_idx += 1
+        inv_owner_key = (investor.lower(), owner.lower())
+        if inv_owner_key not in ownership_by_inv_owner:
+            ownership_by_inv_owner[inv_owner_key] = []
+        ownership_by_inv_owner[inv_owner_key].append(float(pct))
 
-        if not ownership_by_inv_owner:
-            raise ValueError("No Investor Table rows found under the 'Investor' column.")
+        owner_prop_key = (owner.lower(), prop.lower())
+        sums_by_owner_property[owner_prop_key] = sums_by_owner_property.get(owner_prop_key, 0.0) + float(pct)
 
-        tolerance = 0.01
-        bad = []
-        for (owner_k, prop_k), total in sums_by_owner_property.items():
-            if abs(float(total) - 100.0) > tolerance:
-                bad.append((owner_k, prop_k, float(total)))
+        row_idx += 1
 
-        if bad:
-            sample = bad[:10]
-            lines = "; ".join([f"Owner={o} Property={p} Sum={t}" for o, p, t in sample])
-            raise ValueError(
-                f"Investor Table ownership sums must equal 100% for each Owner Property. "
-                f"Found {len(bad)} failures. Sample: {lines}"
-            )
+    if not ownership_by_inv_owner:
+        raise ValueError("No Investor Table rows found under the 'Investor' column.")
+
+    tolerance = 0.01
+    bad = []
+    for (owner_k, prop_k), total in sums_by_owner_property.items():
+        if abs(float(total) - 100.0) > tolerance:
+            bad.append((owner_k, prop_k, float(total)))
+
+    if bad:
+        sample = bad[:10]
+        lines = "; ".join([f"Owner={o} Property={p} Sum={t}" for o, p, t in sample])
+        raise ValueError(
+            f"Investor Table ownership sums must equal 100% for each Owner Property. "
+            f"Found {len(bad)} failures. Sample: {lines}"
+        )
 
-        return ownership_by_inv_owner
+    return ownership_by_inv_owner
+
+def _setup_sheet_rows(xlsx_path: Path, sheet_name: str) -> Optional[Tuple[tuple, ...]]:
+    # main() runs three loaders against the same setup workbook. Each open re-parses shared
+    # strings and styles, so all of their sheets are read in one open and cached per mtime.
+    names = (
+        config.GENERAL_CONFIG_SHEET,
+        config.RUN_CONFIG_SHEET,
+        getattr(config, "INVESTOR_TABLE_SHEET", "Investor Table"),
+    )
+    if sheet_name not in names:
+        names = names + (sheet_name,)
+    path = str(xlsx_path)
+    return _read_setup_sheets(path, os.path.getmtime(path), names).get(sheet_name)
+
+
+@lru_cache(maxsize=4)
+def _read_setup_sheets(xlsx_path: str, mtime: float, sheet_names: Tuple[str, ...]) -> Dict[str, Tuple[tuple, ...]]:
+    wb = load_workbook(filename=xlsx_path, read_only=True, data_only=True)
+    try:
+        return {name: tuple(_sheet_values(wb[name])) for name in sheet_names if name in wb.sheetnames}
     finally:
         wb.close()
 
-def _find_label_value(ws, label_text: str) -> Optional[object]:
-    for row in ws.iter_rows(values_only=False):
-        cell = row[0]
-        if cell.value is None:
+
+def _sheet_values(ws) -> List[tuple]:
+    # One streaming pass over the sheet; everything below indexes these tuples
+    # instead of going through ws.cell, which is very slow on read-only sheets.
+    # Read-only mode trusts the stored <dimension>, which some writers leave stale
+    # (e.g. "A1"); reset it so iter_rows reads every row and column actually present.
+    ws.reset_dimensions()
+    return list(ws.iter_rows(values_only=True))
+
+
+def _cell_value(rows: Sequence[tuple], row_idx: int, col_idx: int) -> Optional[object]:
+    # 1-based like ws.cell; rows past the end or short rows read as empty.
+    if row_idx > len(rows):
+        return None
+    row = rows[row_idx - 1]
+    if col_idx > len(row):
+        return None
+    return row[col_idx - 1]
+
+
+def _find_label_value(label_rows: Sequence[tuple], label_text: str) -> Optional[object]:
+    for row in label_rows:
+        label = row[0] if row else None
+        if label is None:
             continue
-        if str(cell.value).strip() == label_text:
-            return ws.cell(row=cell.row, column=cell.column + 1).value
+        if str(label).strip() == label_text:
+            return row[1] if len(row) > 1 else None
     return None
 
 
-def _find_header_cell(ws, header_text: str) -> Tuple[Optional[int], Optional[int]]:
+def _find_header_cell(rows: Sequence[tuple], header_text: str) -> Tuple[Optional[int], Optional[int]]:
     target = header_text.strip().lower()
-    for r in range(1, min(ws.max_row, 200) + 1):
-        for c in range(1, min(ws.max_column, 100) + 1):
-            v = ws.cell(row=r, column=c).value
+    for r, row in enumerate(rows[:200], start=1):
+        for c, v in enumerate(row[:100], start=1):
             if v is None:
                 continue
             if str(v).strip().lower() == target:
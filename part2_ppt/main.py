@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 _THIS_DIR = Path(__file__).resolve().parent               # ...\Statement_Prep\part2_ppt
@@ -14,9 +16,15 @@ for p in (str(_COMMON_DIR), str(_ROOT_DIR), str(_THIS_DIR)):
 from pptx import Presentation
 
 import config
-from excel_inputs import load_general_config, load_run_config_rows, load_investor_table_ownership_map
+from excel_inputs import (
+    load_general_config,
+    load_general_config_market_values,
+    load_investor_table_ownership_map,
+    load_run_config_rows,
+)
 from ppt_append import combine_presentations
 from ppt_objects import UpdateContext, apply_object_updates
+from sqlite_utils import close_shared_connections, read_snapshot, shared_readonly_connection
 
 def _sanitize_filename_component(s: str) -> str:
     bad = '<>:"/\\|?*'
@@ -24,6 +32,129 @@ def _sanitize_filename_component(s: str) -> str:
     out = out.replace("  ", " ").strip()
     return out
 
+@dataclass(frozen=True)
+class _DeckJob:
+    owner_template_path: Path
+    tmp_updated_path: Path
+    standard_slides_path: Path
+    out_path: Path
+    ctx: UpdateContext
+
+
+def _build_updated_deck(job: _DeckJob) -> None:
+    # Top level so it can run in a worker process; each worker opens its own read-only sqlite connection.
+    prs = Presentation(str(job.owner_template_path))
+
+    # Every updater's reads for this deck share one read transaction on the shared connection.
+    with read_snapshot(shared_readonly_connection(str(config.SQLITE_PATH))):
+        apply_object_updates(prs, job.ctx)
+
+    if job.tmp_updated_path.exists():
+        job.tmp_updated_path.unlink()
+
+    prs.save(str(job.tmp_updated_path))
+    print(f"Saved temp updated deck: {job.tmp_updated_path}")
+
+
+def _combine_deck(job: _DeckJob) -> None:
+    combine_presentations(
+        base_pptx_path=str(job.tmp_updated_path),
+        standard_pptx_path=str(job.standard_slides_path),
+        out_pptx_path=str(job.out_path),
+        ownership_pct=float(job.ctx.ownership_pct),
+    )
+
+    job.tmp_updated_path.unlink()
+
+
+def _prepare_deck_job(
+    idx: int,
+    run,
+    run_count: int,
+    general,
+    ownership_map,
+    market_values_by_type,
+) -> _DeckJob:
+    # Validates one Run Config row and resolves its templates and output paths.
+    statement_thru_yyyymm = general.statement_thru_date.strftime("%Y_%m")
+    inv_key = str(run.investor or "").strip()
+    owner_key = str(run.owner or "").strip()
+    if inv_key == "":
+        raise ValueError(f"Run row {idx} missing Investor value.")
+    if owner_key == "":
+        raise ValueError(f"Run row {idx} missing Owner value for investor '{inv_key}'.")
+
+    map_key = (inv_key.lower(), owner_key.lower())
+    if map_key not in ownership_map:
+        raise ValueError(
+            f"Could not find any properties for Investor Owner in Investor Table for run. "
+            f"Investor: {inv_key}. Owner: {owner_key}"
+        )
+
+    pcts = ownership_map[map_key]
+    if not pcts:
+        raise ValueError(
+            f"Investor Table returned no % Ownership values for run. "
+            f"Investor: {inv_key}. Owner: {owner_key}"
+        )
+
+    all_full = all(float(x) >= 100.0 for x in pcts)
+    ownership_pct = 100.0 if all_full else float(min(pcts))
+    ownership_factor = ownership_pct / 100.0
+
+    print(
+        f"Starting run {idx} of {run_count}. Investor: {inv_key}. Owner: {owner_key}. % Ownership (Investor Table): {ownership_pct}%"
+    )
+
+    owner_template_name = config.OWNER_TEMPLATE_FORMAT.format(owner=_sanitize_filename_component(owner_key))
+    owner_template_path = config.TEMPLATE_DIR / owner_template_name
+    if not owner_template_path.exists():
+        raise FileNotFoundError(f"Missing owner template: {owner_template_path}")
+
+    t1_str = general.statement_thru_date.strftime("%b %Y")
+
+    ctx = UpdateContext(
+        investor=inv_key,
+        owner=owner_key,
+        ownership_pct=ownership_pct,
+        ownership_factor=ownership_factor,
+        statement_thru_date_dt=general.statement_thru_date,
+        statement_thru_date_str=general.statement_thru_date.strftime("%m/%d/%Y"),
+        t1_str=t1_str,
+        market_values_by_type=market_values_by_type,
+    )
+
+    investor_out_dir = general.output_location / inv_key
+    investor_out_dir.mkdir(parents=True, exist_ok=True)
+
+    owner_for_filename = _sanitize_filename_component(owner_key)
+
+    out_name = config.DEFAULT_OUTPUT_FILENAME_FORMAT.format(
+        statement_thru_yyyymm=statement_thru_yyyymm,
+        owner=owner_for_filename,
+    )
+    out_path = investor_out_dir / out_name
+
+    tmp_updated_path = investor_out_dir / f"__tmp_updated_{out_name}"
+
+    chosen_standard = (run.standard_slides_template or "").strip()
+    if chosen_standard == "":
+        chosen_standard = config.STANDARD_SLIDES_FILENAME
+
+    chosen_standard_path = config.TEMPLATE_DIR / chosen_standard
+    if not chosen_standard_path.exists():
+        print(f"Standard slides template not found. Falling back to default. Missing: {chosen_standard_path}")
+        chosen_standard_path = config.TEMPLATE_DIR / config.STANDARD_SLIDES_FILENAME
+
+    return _DeckJob(
+        owner_template_path=owner_template_path,
+        tmp_updated_path=tmp_updated_path,
+        standard_slides_path=chosen_standard_path,
+        out_path=out_path,
+        ctx=ctx,
+    )
+
+
 def main() -> None:
     setup_xlsx = Path(config.SETUP_EXCEL_PATH)
     if not setup_xlsx.exists():
@@ -43,7 +174,10 @@ def main() -> None:
 
     ownership_map = load_investor_table_ownership_map(setup_xlsx)
 
-    statement_thru_yyyymm = general.statement_thru_date.strftime("%Y_%m")
+    # Parsed here once and carried on each UpdateContext; pool workers start with empty
+    # caches and would otherwise re-open the setup workbook for every deck they build.
+    market_values_by_type = load_general_config_market_values(setup_xlsx, config.GENERAL_CONFIG_SHEET)
+
     standard_slides_path = config.TEMPLATE_DIR / config.STANDARD_SLIDES_FILENAME
     if not standard_slides_path.exists():
         raise FileNotFoundError(f"Missing standard slides deck: {standard_slides_path}")
@@ -55,94 +189,39 @@ def main() -> None:
 
     completed = 0
 
-    for idx, run in enumerate(run_rows, start=1):
-
-        inv_key = str(run.investor or "").strip()
-        owner_key = str(run.owner or "").strip()
-        if inv_key == "":
-            raise ValueError(f"Run row {idx} missing Investor value.")
-        if owner_key == "":
-            raise ValueError(f"Run row {idx} missing Owner value for investor '{inv_key}'.")
-
-        map_key = (inv_key.lower(), owner_key.lower())
-        if map_key not in ownership_map:
-            raise ValueError(
-                f"Could not find any properties for Investor Owner in Investor Table for run. "
-                f"Investor: {inv_key}. Owner: {owner_key}"
-            )
-
-        pcts = ownership_map[map_key]
-        if not pcts:
-            raise ValueError(
-                f"Investor Table returned no % Ownership values for run. "
-                f"Investor: {inv_key}. Owner: {owner_key}"
-            )
-
-        all_full = all(float(x) >= 100.0 for x in pcts)
-        ownership_pct = 100.0 if all_full else float(min(pcts))
-        ownership_factor = ownership_pct / 100.0
-
-        print(
-            f"Starting run {idx} of {len(run_rows)}. Investor: {inv_key}. Owner: {owner_key}. % Ownership (Investor Table): {ownership_pct}%"
-        )
-
-        owner_template_name = config.OWNER_TEMPLATE_FORMAT.format(owner=_sanitize_filename_component(owner_key))
-        owner_template_path = config.TEMPLATE_DIR / owner_template_name
-        if not owner_template_path.exists():
-            raise FileNotFoundError(f"Missing owner template: {owner_template_path}")
-
-        prs = Presentation(str(owner_template_path))
-
-        t1_str = general.statement_thru_date.strftime("%b %Y")
-
-        ctx = UpdateContext(
-            investor=inv_key,
-            owner=owner_key,
-            ownership_pct=ownership_pct,
-            ownership_factor=ownership_factor,
-            statement_thru_date_dt=general.statement_thru_date,
-            statement_thru_date_str=general.statement_thru_date.strftime("%m/%d/%Y"),
-            t1_str=t1_str,
-        )
-
-        apply_object_updates(prs, ctx)
-
-        investor_out_dir = general.output_location / inv_key
-        investor_out_dir.mkdir(parents=True, exist_ok=True)
-
-        owner_for_filename = _sanitize_filename_component(owner_key)
-
-        out_name = config.DEFAULT_OUTPUT_FILENAME_FORMAT.format(
-            statement_thru_yyyymm=statement_thru_yyyymm,
-            owner=owner_for_filename,
-        )
-        out_path = investor_out_dir / out_name
-
-        tmp_updated_path = investor_out_dir / f"__tmp_updated_{out_name}"
-        if tmp_updated_path.exists():
-            tmp_updated_path.unlink()
-
-        prs.save(str(tmp_updated_path))
-        print(f"Saved temp updated deck: {tmp_updated_path}")
-
-        chosen_standard = (run.standard_slides_template or "").strip()
-        if chosen_standard == "":
-            chosen_standard = config.STANDARD_SLIDES_FILENAME
-
-        chosen_standard_path = config.TEMPLATE_DIR / chosen_standard
-        if not chosen_standard_path.exists():
-            print(f"Standard slides template not found. Falling back to default. Missing: {chosen_standard_path}")
-            chosen_standard_path = config.TEMPLATE_DIR / config.STANDARD_SLIDES_FILENAME
-
-        combine_presentations(
-            base_pptx_path=str(tmp_updated_path),
-            standard_pptx_path=str(chosen_standard_path),
-            out_pptx_path=str(out_path),
-            ownership_pct=float(ownership_pct),
-        )
-
-        tmp_updated_path.unlink()
-        completed += 1
+    # python-pptx updates are CPU bound and independent per deck, so they can run in worker
+    # processes. The PowerPoint COM combine stays in this process, one deck at a time, and
+    # overlaps with the workers still building later decks.
+    workers = min(int(getattr(config, "PPT_UPDATE_WORKERS", 1) or 1), len(run_rows))
+    if workers > 1:
+        jobs = [
+            _prepare_deck_job(idx, run, len(run_rows), general, ownership_map, market_values_by_type)
+            for idx, run in enumerate(run_rows, start=1)
+        ]
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(_build_updated_deck, job) for job in jobs]
+            for job, fut in zip(jobs, futures):
+                fut.result()
+                _combine_deck(job)
+                completed += 1
+        except BaseException:
+            # Stop queued builds, wait out the ones already running, then remove every temp deck
+            # that never reached _combine_deck (which is the only other place they are unlinked).
+            pool.shutdown(wait=True, cancel_futures=True)
+            for job in jobs[completed:]:
+                try:
+                    job.tmp_updated_path.unlink(missing_ok=True)
+                except OSError as e:
+                    print(f"Could not remove temp updated deck: {job.tmp_updated_path}. {e}")
+            raise
+        pool.shutdown(wait=True)
+    else:
+        for idx, run in enumerate(run_rows, start=1):
+            job = _prepare_deck_job(idx, run, len(run_rows), general, ownership_map, market_values_by_type)
+            _build_updated_deck(job)
+            _combine_deck(job)
+            completed += 1
 
     if bool(getattr(config, "EXPORT_MONTHLY_STMT_XLSX", False)):
         part2_dir = Path(__file__).resolve().parent
@@ -156,6 +235,8 @@ def main() -> None:
 
         export_monthly_stmt_excel()
 
+    close_shared_connections()
+
     print(f"All investors completed. Successful runs: {completed} of {len(run_rows)}")
 
 if __name__ == "__main__":
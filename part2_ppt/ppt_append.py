@@ -2,20 +2,117 @@ from __future__ import annotations
 
 PPT_APPEND_VERBOSE = False
 
-import gc
+import os
+import shutil
+import tempfile
 import time
+import uuid
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
 
 import pythoncom
 import win32com.client
 
-def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx_path: str, ownership_pct: float) -> None:
-    import shutil
-    import time
-    from pathlib import Path
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+
+def _count_slides_in_pptx(pptx_path) -> int:
+    # Read the slide id list straight out of the package instead of opening the deck in PowerPoint.
+    with zipfile.ZipFile(str(pptx_path)) as z:
+        root = ET.fromstring(z.read("ppt/presentation.xml"))
+    sld_id_lst = root.find(f"{{{_P_NS}}}sldIdLst")
+    if sld_id_lst is None:
+        return 0
+    return len(sld_id_lst.findall(f"{{{_P_NS}}}sldId"))
+
+
+_COPY_FILE_NO_BUFFERING = 0x00001000
+_UNBUFFERED_COPY_MIN_BYTES = 32 * 1024 * 1024
+
+
+def _copy_fast(src: Path, dst: Path) -> None:
+    # Large decks are read exactly once, so bypass the cache on Windows instead of
+    # pulling every page through it. Everything else goes through shutil.copyfile,
+    # which already uses CopyFile / sendfile; metadata is not needed for staging copies.
+    if os.name == "nt" and src.stat().st_size > _UNBUFFERED_COPY_MIN_BYTES:
+        import ctypes
+
+        ok = ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, _COPY_FILE_NO_BUFFERING)
+        if ok:
+            return
+    shutil.copyfile(src, dst)
+
 
-    import pythoncom
-    import win32com.client
+def _stage_local(src: Path, dst: Path) -> Path:
+    # Staging only helps when the source sits on another (slow/network) volume.
+    # If it already lives on the staging drive, open it in place and skip the copy.
+    if src.drive and src.drive.lower() == dst.drive.lower():
+        return src
+    _copy_fast(src, dst)
+    return dst
+
+
+def _dispatch_powerpoint():
+    # Early-bound wrapper (makepy) resolves members by dispid instead of GetIDsOfNames on every call.
+    # Fall back to late binding if the gen_py cache cannot be built on this machine.
+    try:
+        return win32com.client.gencache.EnsureDispatch("PowerPoint.Application")
+    except Exception:
+        return win32com.client.DispatchEx("PowerPoint.Application")
+
+
+# MsoTriState values; literal so they work without a makepy typelib cache.
+_MSO_TRUE = -1
+_MSO_FALSE = 0
+
+_NORMAL_TITLE_NAMES = frozenset({
+    "overview_title",
+    "perf_summary_title",
+    "cash_summary_title",
+})
+_PCT_TITLE_NAMES = frozenset({
+    "overview_title_pct",
+    "perf_summary_title_pct",
+    "cash_summary_title_pct",
+    "pct_owner_note",
+})
+
+_VISIBILITY_BY_PARTIAL: dict[bool, dict[str, int]] = {
+    is_partial: {
+        **{nm: (_MSO_FALSE if is_partial else _MSO_TRUE) for nm in _NORMAL_TITLE_NAMES},
+        **{nm: (_MSO_TRUE if is_partial else _MSO_FALSE) for nm in _PCT_TITLE_NAMES},
+    }
+    for is_partial in (False, True)
+}
+
+
+def _apply_visibility_rules_to_presentation(pres_obj, ownership_pct_value: float) -> None:
+    # If ownership < 100: show *_pct + pct_owner_note, hide normal titles
+    # If ownership = 100: show normal titles, hide *_pct + pct_owner_note
+    is_partial = float(ownership_pct_value or 0.0) < 100.0
+    visible_by_name = _VISIBILITY_BY_PARTIAL[is_partial]
+
+    # Apply by COM Visible property (most reliable for PowerPoint)
+    for s_idx in range(1, pres_obj.Slides.Count + 1):
+        slide_obj = pres_obj.Slides(s_idx)
+        for sh_idx in range(1, slide_obj.Shapes.Count + 1):
+            shp = slide_obj.Shapes(sh_idx)
+            try:
+                nm = str(shp.Name or "").strip()
+            except Exception:
+                continue
+            visible = visible_by_name.get(nm)
+            if visible is None:
+                continue
+            try:
+                shp.Visible = visible
+            except Exception:
+                # If a shape type doesn't support Visible, skip silently
+                pass
 
+
+def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx_path: str, ownership_pct: float) -> None:
     def _log(msg: str) -> None:
         if PPT_APPEND_VERBOSE:
             print(msg)
@@ -32,9 +129,6 @@ def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx
     std_src = Path(standard_pptx_path)
     out_dst = Path(out_pptx_path)
 
-    import tempfile
-    import uuid
-
     tmp_dir = Path(tempfile.gettempdir()) / "statement_prep_ppt" / str(uuid.uuid4())[:8]
     tmp_dir.mkdir(parents=True, exist_ok=True)
 
@@ -50,9 +144,9 @@ def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx
     _log(f"  staging:  {tmp_dir}")
 
     t0 = _now()
-    shutil.copy2(base_src, base_local)
+    base_local = _stage_local(base_src, base_local)
     t_copy_base = _now()
-    shutil.copy2(std_src, std_local)
+    std_local = _stage_local(std_src, std_local)
     t_copy_std = _now()
 
     _log(f"  copy base to local: {_fmt(t_copy_base - t0)}")
@@ -62,11 +156,10 @@ def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx
 
     ppt = None
     pres = None
-    std_pres = None
 
     try:
         t1 = _now()
-        ppt = win32com.client.DispatchEx("PowerPoint.Application")
+        ppt = _dispatch_powerpoint()
         t2 = _now()
 
         try:
@@ -74,112 +167,33 @@ def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx
         except Exception:
             pass
 
-        _log(f"  DispatchEx PowerPoint: {_fmt(t2 - t1)}")
+        try:
+            # msoAutomationSecurityForceDisable: never load macros/add-in code from the decks we open.
+            ppt.AutomationSecurity = 3
+        except Exception:
+            pass
+
+        _log(f"  Dispatch PowerPoint: {_fmt(t2 - t1)}")
 
         t3 = _now()
         pres = ppt.Presentations.Open(str(base_local), WithWindow=False)
+        try:
+            pres.AutoSaveOn = False
+        except Exception:
+            # Only present on subscription builds of PowerPoint.
+            pass
         t4 = _now()
         _log(f"  Open base (local): {_fmt(t4 - t3)}")
 
-        t_std0 = _now()
-        std_pres = ppt.Presentations.Open(str(std_local), WithWindow=False, ReadOnly=True)
-        std_slide_count = std_pres.Slides.Count
-        std_pres.Close()
-        std_pres = None
-        t_std1 = _now()
-        _log(f"  Open std for count (local): {_fmt(t_std1 - t_std0)} slides: {std_slide_count}")
-
-        def _apply_visibility_rules_to_presentation(pres_obj, ownership_pct_value: float) -> None:
-            # If ownership < 100: show *_pct + pct_owner_note, hide normal titles
-            # If ownership = 100: show normal titles, hide *_pct + pct_owner_note
-            from win32com.client import constants as c
-
-            is_partial = float(ownership_pct_value or 0.0) < 100.0
-
-            normal_names = {
-                "overview_title",
-                "perf_summary_title",
-                "cash_summary_title",
-            }
-            pct_names = {
-                "overview_title_pct",
-                "perf_summary_title_pct",
-                "cash_summary_title_pct",
-                "pct_owner_note",
-            }
-
-            def _should_show(shape_name: str) -> bool:
-                if shape_name in normal_names:
-                    return not is_partial
-                if shape_name in pct_names:
-                    return is_partial
-                return True
-
-            # Apply by COM Visible property (most reliable for PowerPoint)
-            for s_idx in range(1, pres_obj.Slides.Count + 1):
-                slide_obj = pres_obj.Slides(s_idx)
-                for sh_idx in range(1, slide_obj.Shapes.Count + 1):
-                    shp = slide_obj.Shapes(sh_idx)
-                    try:
-                        nm = str(shp.Name or "").strip()
-                    except Exception:
-                        continue
-                    if nm == "":
-                        continue
-                    if nm in normal_names or nm in pct_names:
-                        try:
-                            shp.Visible = c.msoTrue if _should_show(nm) else c.msoFalse
-                        except Exception:
-                            # If a shape type doesn't support Visible, skip silently
-                            pass
-
-        def _apply_visibility_rules_to_presentation(pres_obj, ownership_pct_value: float) -> None:
-            # If ownership < 100: show *_pct + pct_owner_note, hide normal titles
-            # If ownership = 100: show normal titles, hide *_pct + pct_owner_note
-            from win32com.client import constants as c
-
-            is_partial = float(ownership_pct_value or 0.0) < 100.0
-
-            normal_names = {
-                "overview_title",
-                "perf_summary_title",
-                "cash_summary_title",
-            }
-            pct_names = {
-                "overview_title_pct",
-                "perf_summary_title_pct",
-                "cash_summary_title_pct",
-                "pct_owner_note",
-            }
-
-            def _should_show(shape_name: str) -> bool:
-                if shape_name in normal_names:
-                    return not is_partial
-                if shape_name in pct_names:
-                    return is_partial
-                return True
-
-            # Apply by COM Visible property (most reliable for PowerPoint)
-            for s_idx in range(1, pres_obj.Slides.Count + 1):
-                slide_obj = pres_obj.Slides(s_idx)
-                for sh_idx in range(1, slide_obj.Shapes.Count + 1):
-                    shp = slide_obj.Shapes(sh_idx)
-                    try:
-                        nm = str(shp.Name or "").strip()
-                    except Exception:
-                        continue
-                    if nm == "":
-                        continue
-                    if nm in normal_names or nm in pct_names:
-                        try:
-                            shp.Visible = c.msoTrue if _should_show(nm) else c.msoFalse
-                        except Exception:
-                            # If a shape type doesn't support Visible, skip silently
-                            pass
-
         t5 = _now()
         insert_index = pres.Slides.Count
-        pres.Slides.InsertFromFile(str(std_local), insert_index, 1, std_slide_count)
+        try:
+            # SlideStart/SlideEnd omitted: PowerPoint inserts every slide of the source deck.
+            pres.Slides.InsertFromFile(str(std_local), insert_index)
+        except Exception:
+            std_slide_count = _count_slides_in_pptx(std_local)
+            _log(f"  InsertFromFile defaults rejected, using explicit range 1..{std_slide_count}")
+            pres.Slides.InsertFromFile(str(std_local), insert_index, 1, std_slide_count)
         t6 = _now()
         _log(f"  InsertFromFile std (local): {_fmt(t6 - t5)}")
 
@@ -198,23 +212,20 @@ def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx
         _log(f"  SaveAs out (local): {_fmt(t8 - t7)}")
 
     finally:
-        try:
-            if std_pres is not None:
-                std_pres.Close()
-        except Exception:
-            pass
-
         try:
             if pres is not None:
                 pres.Close()
         except Exception:
             pass
+        pres = None
 
         try:
             if ppt is not None:
                 ppt.Quit()
         except Exception:
             pass
+        # Drop the last COM references before uninitializing so refcounting releases them.
+        ppt = None
 
         try:
             pythoncom.CoUninitialize()
@@ -223,7 +234,7 @@ def combine_presentations(base_pptx_path: str, standard_pptx_path: str, out_pptx
 
     t9 = _now()
     out_dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(out_local, out_dst)
+    _copy_fast(out_local, out_dst)
     t10 = _now()
     _log(f"  copy out to destination: {_fmt(t10 - t9)}")
     _log(f"  total combine time: {_fmt(t10 - t0)}")
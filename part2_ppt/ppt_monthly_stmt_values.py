@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import sqlite3
-from datetime import date
+import calendar
+import os
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import config
 from ppt_objects import UpdateContext
+from sqlite_utils import shared_readonly_connection
 
 
 _TIMEFRAMES = [f"[T{n}]" for n in range(1, 14)]
@@ -29,11 +32,8 @@ def list_investor_owner_property_triplets() -> List[Tuple[str, str, str]]:
         ORDER BY investor, owner, property
     """
 
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    try:
-        rows = con.execute(sql).fetchall()
-    finally:
-        con.close()
+    con = shared_readonly_connection(str(config.SQLITE_PATH))
+    rows = con.execute(sql)
 
     out: List[Tuple[str, str, str]] = []
     for inv, own, prop in rows:
@@ -41,60 +41,172 @@ def list_investor_owner_property_triplets() -> List[Tuple[str, str, str]]:
     return out
 
 
-def _owner_filter_sql(ctx: UpdateContext) -> tuple[str, tuple]:
-    if ctx.owner is None or str(ctx.owner).strip() == "":
-        return "", tuple()
-    return " AND owner = ? ", (str(ctx.owner).strip(),)
+def _owner_param(ctx: UpdateContext) -> str:
+    if ctx.owner is None:
+        return ""
+    return str(ctx.owner).strip()
 
 
-def _property_filter_sql(property_name: Optional[str]) -> tuple[str, tuple]:
-    if property_name is None or str(property_name).strip() == "":
-        return "", tuple()
-    return " AND property = ? ", (str(property_name).strip(),)
+def _property_param(property_name: Optional[str]) -> str:
+    if property_name is None:
+        return ""
+    return str(property_name).strip()
 
 
 def _timeframe_list_sql() -> str:
     return ",".join([f"'{tf}'" for tf in _TIMEFRAMES])
 
 
-def build_month_year_labels(ctx: UpdateContext, property_name: Optional[str]) -> Dict[str, str]:
-    """
-    Returns mapping: [Tn] -> "Mon YYYY"
-    Matches the PPT logic: uses MAX(month_start) for each timeframe token.
-    """
-    owner_sql, owner_params = _owner_filter_sql(ctx)
-    prop_sql, prop_params = _property_filter_sql(property_name)
+_PERF_CATEGORIES = (
+    "Rent",
+    "Dividend",
+    "HOA & Mgt. Fee",
+    "Repairs & Other Exp.",
+    "Mortgage Interest",
+)
+
+def _filtered_sql(template: str) -> Dict[Tuple[bool, bool], str]:
+    # One fixed SQL text per (owner filter, property filter) combination, picked in Python:
+    # each stays a plain equality SQLite can seek on in the gl_agg indexes, and each text
+    # is still reused from sqlite3's statement cache.
+    return {
+        (by_owner, by_prop): template.format(
+            owner_filter="AND owner = ?" if by_owner else "",
+            property_filter="AND property = ?" if by_prop else "",
+        )
+        for by_owner in (False, True)
+        for by_prop in (False, True)
+    }
 
-    sql = f"""
-        SELECT timeframe, MAX(month_start) AS month_start
-        FROM gl_agg
-        WHERE investor = ?
-          AND timeframe IS NOT NULL
-          AND timeframe <> 'N/A'
-          AND timeframe IN ({_timeframe_list_sql()})
-          AND month_start IS NOT NULL
-          {owner_sql}
-          {prop_sql}
-        GROUP BY timeframe
-    """
 
-    con = sqlite3.connect(str(config.SQLITE_PATH))
+def _filter_key(owner: str, prop: str) -> Tuple[bool, bool]:
+    return owner != "", prop != ""
+
+
+def _filter_params(owner: str, prop: str) -> Tuple[str, ...]:
+    # Bound in the same order as {owner_filter} then {property_filter}.
+    return tuple(v for v in (owner, prop) if v != "")
+
+
+_SQL_MONTH_YEAR_LABELS = _filtered_sql(f"""
+    SELECT timeframe, MAX(month_start) AS month_start
+    FROM gl_agg
+    WHERE investor = ?
+      AND timeframe IS NOT NULL
+      AND timeframe <> 'N/A'
+      AND timeframe IN ({_timeframe_list_sql()})
+      AND month_start IS NOT NULL
+      {{owner_filter}}
+      {{property_filter}}
+    GROUP BY timeframe
+""")
+
+# Labels for every investor in one pass, same shape as the monthly perf aggregate:
+# {owner_col} is owner for owner-level decks, or NULL for decks without an owner filter.
+_SQL_MONTH_YEAR_LABELS_ALL_INVESTORS = f"""
+    SELECT investor,
+           {{owner_col}} AS owner_key,
+           timeframe,
+           MAX(month_start) AS month_start
+    FROM gl_agg
+    WHERE timeframe IS NOT NULL
+      AND timeframe <> 'N/A'
+      AND timeframe IN ({_timeframe_list_sql()})
+      AND month_start IS NOT NULL
+    GROUP BY investor, owner_key, timeframe
+"""
+
+# Revenue/expense rows are stored with the opposite sign of how the PPT presents them;
+# flip inside the aggregate so SQLite returns one signed total per category.
+_SQL_MONTHLY_PERF_TOTALS = _filtered_sql(f"""
+    SELECT
+        categorization,
+        SUM(
+            CASE WHEN LOWER(TRIM(COALESCE(gl_mapping_type, ''))) IN ('revenue', 'expense')
+                 THEN -value
+                 ELSE value
+            END
+        ) AS signed_total
+    FROM gl_agg
+    WHERE investor = ?
+      AND (timeframe IS NULL OR timeframe <> 'N/A')
+      AND timeframe IN ({_timeframe_list_sql()})
+      AND categorization IN ({",".join(["?"] * len(_PERF_CATEGORIES))})
+      {{owner_filter}}
+      {{property_filter}}
+    GROUP BY categorization
+""")
+
+_SQL_MONTHLY_CASH_TOTALS = _filtered_sql(f"""
+    SELECT
+        cash_categorization,
+        cash_type_mapping,
+        SUM(cash_value) AS total_value
+    FROM gl_agg
+    WHERE investor = ?
+      AND (timeframe IS NULL OR timeframe <> 'N/A')
+      AND timeframe IN ({_timeframe_list_sql()})
+      {{owner_filter}}
+      {{property_filter}}
+    GROUP BY cash_categorization, cash_type_mapping
+""")
+
+
+def _month_year_label(ms: object) -> Optional[str]:
+    # month_start is ISO YYYY-MM-DD: slice the ints and look the month name up
+    # (calendar.month_abbr is built from the same %b strftime) instead of date() + strftime per row.
+    s = str(ms)
     try:
-        rows = con.execute(sql, (ctx.investor, *owner_params, *prop_params)).fetchall()
-    finally:
-        con.close()
+        y = int(s[:4])
+        m = int(s[5:7])
+    except ValueError:
+        return None
+    if not 1 <= m <= 12 or y < 1:
+        return None
+    return f"{calendar.month_abbr[m]} {y}"
+
 
-    token_to_label: Dict[str, str] = {}
+@lru_cache(maxsize=256)
+def _month_year_label_items(db_path: str, mtime: float, investor: str, owner: str, prop: str) -> Tuple[Tuple[str, str], ...]:
+    con = shared_readonly_connection(db_path)
+    rows = con.execute(_SQL_MONTH_YEAR_LABELS[_filter_key(owner, prop)], (investor, *_filter_params(owner, prop)))
+
+    items: List[Tuple[str, str]] = []
     for tf, ms in rows:
-        try:
-            y = int(str(ms)[:4])
-            m = int(str(ms)[5:7])
-            dt = date(y, m, 1)
-            token_to_label[str(tf).strip()] = dt.strftime("%b %Y")
-        except Exception:
-            continue
+        label = _month_year_label(ms)
+        if label is not None:
+            items.append((str(tf).strip(), label))
+    return tuple(items)
+
 
-    return token_to_label
+@lru_cache(maxsize=4)
+def _month_year_labels_by_investor(db_path: str, mtime: float, by_owner: bool) -> Dict[Tuple[str, Optional[str]], Tuple[Tuple[str, str], ...]]:
+    # One grouped scan per db mtime serves every deck in the run, instead of one label query per deck.
+    con = shared_readonly_connection(db_path)
+    sql = _SQL_MONTH_YEAR_LABELS_ALL_INVESTORS.format(owner_col="owner" if by_owner else "NULL")
+
+    out: Dict[Tuple[str, Optional[str]], List[Tuple[str, str]]] = {}
+    for inv, own, tf, ms in con.execute(sql):
+        label = _month_year_label(ms)
+        if label is not None:
+            out.setdefault((inv, own), []).append((str(tf).strip(), label))
+    return {k: tuple(v) for k, v in out.items()}
+
+
+def build_month_year_labels(ctx: UpdateContext, property_name: Optional[str]) -> Dict[str, str]:
+    """
+    Returns mapping: [Tn] -> "Mon YYYY"
+    Matches the PPT logic: uses MAX(month_start) for each timeframe token.
+    Memoized per investor/owner/property on the db mtime; the perf, cash and ni tables all ask for the same labels.
+    """
+    db_path = str(config.SQLITE_PATH)
+    mtime = os.path.getmtime(db_path)
+    owner = _owner_param(ctx)
+    prop = _property_param(property_name)
+    if prop == "":
+        by_investor = _month_year_labels_by_investor(db_path, mtime, owner != "")
+        return dict(by_investor.get((ctx.investor, owner or None), ()))
+    return dict(_month_year_label_items(db_path, mtime, ctx.investor, owner, prop))
 
 
 def build_monthly_perf_totals(ctx: UpdateContext, property_name: Optional[str]) -> Dict[str, float]:
@@ -102,48 +214,18 @@ def build_monthly_perf_totals(ctx: UpdateContext, property_name: Optional[str])
     Returns totals for the full T1 to T13 aggregation, per property if property_name provided.
     Keys match the PPT columns.
     """
-    owner_sql, owner_params = _owner_filter_sql(ctx)
-    prop_sql, prop_params = _property_filter_sql(property_name)
-
-    wanted_cats = (
-        "Rent",
-        "Dividend",
-        "HOA & Mgt. Fee",
-        "Repairs & Other Exp.",
-        "Mortgage Interest",
-    )
-    placeholders = ",".join(["?"] * len(wanted_cats))
-
-    sql = f"""
-        SELECT categorization, gl_mapping_type, SUM(value) AS total_value
-        FROM gl_agg
-        WHERE investor = ?
-          AND (timeframe IS NULL OR timeframe <> 'N/A')
-          AND timeframe IN ({_timeframe_list_sql()})
-          AND categorization IN ({placeholders})
-          {owner_sql}
-          {prop_sql}
-        GROUP BY categorization, gl_mapping_type
-    """
+    owner = _owner_param(ctx)
+    prop = _property_param(property_name)
 
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    try:
-        rows = con.execute(sql, (ctx.investor, *wanted_cats, *owner_params, *prop_params)).fetchall()
-    finally:
-        con.close()
-
-    cat_totals: Dict[str, float] = {k: 0.0 for k in wanted_cats}
-
-    for cat, mapping_type, total_value in rows:
-        cat_key = str(cat).strip()
-        mt = str(mapping_type or "").strip().lower()
-        v = float(total_value or 0.0)
-
-        if mt in ("revenue", "expense"):
-            v = -1.0 * v
+    con = shared_readonly_connection(str(config.SQLITE_PATH))
+    rows = con.execute(
+        _SQL_MONTHLY_PERF_TOTALS[_filter_key(owner, prop)],
+        (ctx.investor, *_PERF_CATEGORIES, *_filter_params(owner, prop)),
+    )
 
-        if cat_key in cat_totals:
-            cat_totals[cat_key] += v
+    cat_totals: Dict[str, float] = {k: 0.0 for k in _PERF_CATEGORIES}
+    for cat, signed_total in rows:
+        cat_totals[cat] = float(signed_total or 0.0)
 
     rent = float(cat_totals.get("Rent", 0.0))
     dividend = float(cat_totals.get("Dividend", 0.0))
@@ -175,30 +257,13 @@ def build_monthly_cash_totals(ctx: UpdateContext, property_name: Optional[str])
     Returns totals for the full T1 to T13 aggregation, per property if property_name provided.
     Keys match the PPT columns.
     """
-    owner_sql, owner_params = _owner_filter_sql(ctx)
-    prop_sql, prop_params = _property_filter_sql(property_name)
-
-    sql = f"""
-        SELECT
-            cash_categorization,
-            cash_type_mapping,
-            SUM(cash_value) AS total_value
-        FROM gl_agg
-        WHERE investor = ?
-          AND (timeframe IS NULL OR timeframe <> 'N/A')
-          AND timeframe IN ({_timeframe_list_sql()})
-          {owner_sql}
-          {prop_sql}
-        GROUP BY cash_categorization, cash_type_mapping
-    """
+    owner = _owner_param(ctx)
+    prop = _property_param(property_name)
 
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    try:
-        rows = con.execute(sql, (ctx.investor, *owner_params, *prop_params)).fetchall()
-    finally:
-        con.close()
+    con = shared_readonly_connection(str(config.SQLITE_PATH))
+    rows = con.execute(_SQL_MONTHLY_CASH_TOTALS[_filter_key(owner, prop)], (ctx.investor, *_filter_params(owner, prop)))
 
-    by_cat: Dict[str, float] = {}
+    by_cat: Dict[str, float] = defaultdict(float)
     inflow_total = 0.0
     outflow_total = 0.0
 
@@ -233,7 +298,7 @@ def build_monthly_cash_totals(ctx: UpdateContext, property_name: Optional[str])
                 v_signed = 0.0
 
         if cat_key != "":
-            by_cat[cat_key] = by_cat.get(cat_key, 0.0) + v_signed
+            by_cat[cat_key] += v_signed
 
     owner_contrib = float(by_cat.get("Owner Contribution", 0.0))
     mortgage_loan = float(by_cat.get("Mortgage Loan", 0.0))
@@ -34,6 +34,18 @@ from ppt_object_logic_visibility import update_partial_ownership_visibility
 
 
 def _chain(*updaters: ObjectUpdater) -> ObjectUpdater:
+    # Fuse once at import so per-shape dispatch is a direct call, not a loop over a tuple.
+    if len(updaters) == 1:
+        return updaters[0]
+
+    if len(updaters) == 2:
+        first, second = updaters
+
+        def _fused(slide, shape, prs, ctx) -> None:
+            first(slide, shape, prs, ctx)
+            second(slide, shape, prs, ctx)
+        return _fused
+
     def _runner(slide, shape, prs, ctx) -> None:
         for u in updaters:
             u(slide, shape, prs, ctx)
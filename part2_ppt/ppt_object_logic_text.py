@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import sqlite3
-from typing import Dict
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Tuple
 
 import config
 
@@ -10,13 +12,10 @@ from pptx.shapes.base import BaseShape
 from pptx.slide import Slide
 
 from ppt_objects import UpdateContext
-from ppt_text_replace import replace_tokens_in_shape
+from ppt_text_replace import replace_tokens_in_shape, token_pattern
 from ppt_objects import apply_ownership_amount
-
-def _owner_filter_sql(ctx: UpdateContext) -> tuple[str, tuple]:
-    if ctx.owner is None or str(ctx.owner).strip() == "":
-        return "", tuple()
-    return " AND owner = ? ", (str(ctx.owner).strip(),)
+from ppt_object_logic_tables import _header_columns
+from sqlite_utils import shared_readonly_connection
 
 def _replace_tokens_in_shape_robust(shape: BaseShape, token_map: Dict[str, str]) -> int:
     """
@@ -27,31 +26,32 @@ def _replace_tokens_in_shape_robust(shape: BaseShape, token_map: Dict[str, str])
     """
     count = 0
 
+    pat = token_pattern(token_map)
+    if pat is None or not getattr(shape, "has_text_frame", False):
+        return count
+
+    tf = shape.text_frame
+
+    # Every paragraph's joined run text is a substring of all run texts joined, so one
+    # search there rules out both passes for shapes that carry none of the tokens.
+    if pat.search("".join(t.text or "" for t in tf._txBody.xpath("./a:p/a:r/a:t"))) is None:
+        return count
+
     try:
         count += int(replace_tokens_in_shape(shape, token_map) or 0)
     except Exception:
         pass
 
-    if not getattr(shape, "has_text_frame", False):
-        return count
+    def _sub(m: "re.Match[str]") -> str:
+        return token_map[m.group(0)]
 
-    tf = shape.text_frame
     for p in tf.paragraphs:
         runs = list(p.runs)
         if not runs:
             continue
 
         full = "".join(r.text for r in runs)
-        new = full
-
-        para_repls = 0
-        for k, v in token_map.items():
-            if not k:
-                continue
-            occurrences = new.count(k)
-            if occurrences:
-                para_repls += occurrences
-                new = new.replace(k, v)
+        new, para_repls = pat.subn(_sub, full)
 
         if new != full:
             runs[0].text = new
@@ -95,62 +95,81 @@ def _fmt_usd_short_k(x: float) -> str:
     return f"${k:,}K"
 
 
+_SQL_INVESTOR_OWNERS = """
+    SELECT DISTINCT owner
+    FROM gl_agg
+    WHERE investor = ?
+      AND owner IS NOT NULL
+      AND TRIM(owner) <> ''
+      AND (timeframe IS NULL OR timeframe <> 'N/A')
+"""
+
+
+@lru_cache(maxsize=32)
+def _investor_owners_cached(db_path: str, mtime: float, investor: str) -> str:
+    con = shared_readonly_connection(db_path)
+    return _join_owner_list_for_display([r[0] for r in con.execute(_SQL_INVESTOR_OWNERS, (investor,))])
+
+
 def _get_investor_owners(investor: str) -> str:
-    sql = """
-        SELECT DISTINCT owner
-        FROM gl_agg
-        WHERE investor = ?
-          AND owner IS NOT NULL
-          AND TRIM(owner) <> ''
-          AND (timeframe IS NULL OR timeframe <> 'N/A')
-        ORDER BY owner
-    """
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    rows = con.execute(sql, (investor,)).fetchall()
-    con.close()
-    return _join_owner_list_for_display([r[0] for r in rows])
+    # Every title shape on a deck without an owner asks for the same list.
+    db_path = str(config.SQLITE_PATH)
+    return _investor_owners_cached(db_path, os.path.getmtime(db_path), investor)
+
+
+# Total invested, mortgage balance and income (all periods and T1..T13) in one scan.
+# Fixed texts with and without the owner clause, so an owner deck seeks on the index.
+_SQL_PORTFOLIO_TOTALS_TEMPLATE = """
+    SELECT
+        COALESCE(ABS(SUM(CASE WHEN categorization = 'Total Invested' THEN value ELSE 0 END)), 0.0) AS invested,
+        COALESCE(ABS(SUM(CASE WHEN categorization = 'Mortgage Balance' THEN value ELSE 0 END)), 0.0) AS mortgage,
+        COALESCE(SUM(
+            CASE
+                WHEN UPPER(TRIM(COALESCE(gl_mapping_type, ''))) = 'REVENUE' THEN -1.0 * value
+                WHEN UPPER(TRIM(COALESCE(gl_mapping_type, ''))) = 'EXPENSE' THEN -1.0 * value
+                ELSE 0.0
+            END
+        ), 0.0) AS income,
+        COALESCE(SUM(
+            CASE
+                WHEN timeframe IN ('[T1]','[T2]','[T3]','[T4]','[T5]','[T6]','[T7]','[T8]','[T9]','[T10]','[T11]','[T12]','[T13]')
+                 AND UPPER(TRIM(COALESCE(gl_mapping_type, ''))) IN ('REVENUE', 'EXPENSE') THEN -1.0 * value
+                ELSE 0.0
+            END
+        ), 0.0) AS cumulative_income
+    FROM gl_agg
+    WHERE investor = ?
+      AND (timeframe IS NULL OR timeframe <> 'N/A')
+      {owner_filter}
+"""
+_SQL_PORTFOLIO_TOTALS = _SQL_PORTFOLIO_TOTALS_TEMPLATE.format(owner_filter="")
+_SQL_PORTFOLIO_TOTALS_FOR_OWNER = _SQL_PORTFOLIO_TOTALS_TEMPLATE.format(owner_filter="AND owner = ?")
+
+
+@lru_cache(maxsize=32)
+def _portfolio_totals_cached(db_path: str, mtime: float, investor: str, owner: str) -> Tuple[float, float, float, float]:
+    con = shared_readonly_connection(db_path)
+    if owner:
+        cur = con.execute(_SQL_PORTFOLIO_TOTALS_FOR_OWNER, (investor, owner))
+    else:
+        cur = con.execute(_SQL_PORTFOLIO_TOTALS, (investor,))
+    # An ungrouped aggregate always returns exactly one row, and every sum is COALESCEd in SQL.
+    invested, mortgage, income, cumulative_income = cur.fetchone()
+    return float(invested), float(mortgage), float(income), float(cumulative_income)
+
+
+def _portfolio_totals(ctx: UpdateContext) -> Tuple[float, float, float, float]:
+    # (invested, mortgage, income, cumulative_income) raw values, shared by every text updater on the deck.
+    db_path = str(config.SQLITE_PATH)
+    owner = "" if ctx.owner is None else str(ctx.owner).strip()
+    return _portfolio_totals_cached(db_path, os.path.getmtime(db_path), ctx.investor, owner)
 
 def _get_portfolio_total_invested(ctx: UpdateContext) -> float:
-    owner_sql, owner_params = _owner_filter_sql(ctx)
-    sql = f"""
-        SELECT ABS(SUM(value)) AS total_invested
-        FROM gl_agg
-        WHERE investor = ?
-          AND categorization = 'Total Invested'
-          AND (timeframe IS NULL OR timeframe <> 'N/A')
-          {owner_sql}
-    """
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    row = con.execute(sql, (ctx.investor, *owner_params)).fetchone()
-    con.close()
-    raw = float((row[0] if row and row[0] is not None else 0.0))
+    raw = _portfolio_totals(ctx)[0]
     return apply_ownership_amount(ctx, raw, "text.total_invested")
 
 def _get_portfolio_cumulative_return_amount(ctx: UpdateContext) -> float:
-    owner_sql, owner_params = _owner_filter_sql(ctx)
-    sql = f"""
-        SELECT
-            ABS(SUM(CASE WHEN categorization = 'Total Invested' THEN value ELSE 0 END)) AS invested,
-            ABS(SUM(CASE WHEN categorization = 'Mortgage Balance' THEN value ELSE 0 END)) AS mortgage,
-            SUM(
-                CASE
-                    WHEN UPPER(TRIM(COALESCE(gl_mapping_type, ''))) = 'REVENUE' THEN -1.0 * value
-                    WHEN UPPER(TRIM(COALESCE(gl_mapping_type, ''))) = 'EXPENSE' THEN -1.0 * value
-                    ELSE 0.0
-                END
-            ) AS income
-        FROM gl_agg
-        WHERE investor = ?
-          AND (timeframe IS NULL OR timeframe <> 'N/A')
-          {owner_sql}
-    """
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    row = con.execute(sql, (ctx.investor, *owner_params)).fetchone()
-    con.close()
-
-    invested_raw = float(row[0] or 0.0)
-    mortgage_raw = float(row[1] or 0.0)
-    income_raw = float(row[2] or 0.0)
+    invested_raw, mortgage_raw, income_raw, _ = _portfolio_totals(ctx)
 
     invested = apply_ownership_amount(ctx, invested_raw, "text.invested")
     mortgage = apply_ownership_amount(ctx, mortgage_raw, "text.mortgage_balance")
@@ -160,26 +179,7 @@ def _get_portfolio_cumulative_return_amount(ctx: UpdateContext) -> float:
     return nav + income - invested
 
 def _get_portfolio_cumulative_income(ctx: UpdateContext) -> float:
-    owner_sql, owner_params = _owner_filter_sql(ctx)
-    sql = f"""
-        SELECT
-            SUM(
-                CASE
-                    WHEN UPPER(TRIM(COALESCE(gl_mapping_type, ''))) = 'REVENUE' THEN -1.0 * value
-                    WHEN UPPER(TRIM(COALESCE(gl_mapping_type, ''))) = 'EXPENSE' THEN -1.0 * value
-                    ELSE 0.0
-                END
-            ) AS cumulative_income
-        FROM gl_agg
-        WHERE investor = ?
-          AND (timeframe IS NULL OR timeframe <> 'N/A')
-          AND timeframe IN ('[T1]','[T2]','[T3]','[T4]','[T5]','[T6]','[T7]','[T8]','[T9]','[T10]','[T11]','[T12]','[T13]')
-          {owner_sql}
-    """
-    con = sqlite3.connect(str(config.SQLITE_PATH))
-    row = con.execute(sql, (ctx.investor, *owner_params)).fetchone()
-    con.close()
-    raw = float((row[0] if row and row[0] is not None else 0.0))
+    raw = _portfolio_totals(ctx)[3]
     return apply_ownership_amount(ctx, raw, "text.cumulative_income_timeframes")
 
 def _pct_token(ctx: UpdateContext) -> str:
@@ -268,35 +268,65 @@ def update_cash_summary_title_pct(slide: Slide, shape: BaseShape, prs: Presentat
     count = _replace_tokens_in_shape_robust(shape, token_map)
     print(f"cash_summary_title_pct replacements applied: {count}")
 
-def update_summary_top_text(slide: Slide, shape: BaseShape, prs: Presentation, ctx: UpdateContext) -> None:
-    def _norm_header(s: str) -> str:
-        return (s or "").replace("\r", "").replace(" \n", "\n").strip()
-
-    def _parse_currency(s: str) -> float:
-        t = (s or "").strip()
-        if t == "" or t == "-":
-            return 0.0
-        neg = False
-        if t.startswith("(") and t.endswith(")"):
-            neg = True
-            t = t[1:-1]
-        t = t.replace("$", "").replace(",", "").strip()
-        try:
-            v = float(t)
-        except Exception:
-            v = 0.0
-        return -v if neg else v
-
-    def _parse_percent(s: str) -> float:
-        t = (s or "").strip()
-        if t == "" or t == "-":
-            return 0.0
-        t = t.replace("%", "").replace(",", "").strip()
-        try:
-            return float(t) / 100.0
-        except Exception:
-            return 0.0
+# Cells as the table writers emit them: "$1,234", "($1,234)", "-$1,234", "12.3%", "-".
+# Text that does not match (exponents, underscores, stray "$"/"%") goes through the
+# original strip/replace/float() chain, so hand-edited totals rows parse as they always did.
+_CURRENCY_RE = re.compile(r"\s*(\()?\s*([-+]?\$?-?)(\s*)([\d,]*\.?\d*)\s*(?(1)\))\s*")
+_PERCENT_RE = re.compile(r"\s*([-+]?[\d,]*\.?\d*)\s*%?\s*")
+
+
+def _parse_currency_fallback(s: str) -> float:
+    t = (s or "").strip()
+    if t == "" or t == "-":
+        return 0.0
+    neg = False
+    if t.startswith("(") and t.endswith(")"):
+        neg = True
+        t = t[1:-1]
+    t = t.replace("$", "").replace(",", "").strip()
+    try:
+        v = float(t)
+    except Exception:
+        v = 0.0
+    return -v if neg else v
+
+
+def _parse_percent_fallback(s: str) -> float:
+    t = (s or "").strip()
+    if t == "" or t == "-":
+        return 0.0
+    t = t.replace("%", "").replace(",", "").strip()
+    try:
+        return float(t) / 100.0
+    except Exception:
+        return 0.0
+
+
+def _parse_currency(s: str) -> float:
+    m = _CURRENCY_RE.fullmatch(s or "")
+    if m is None or (m.group(3) and m.group(2).strip("$")):
+        # float() rejects a sign separated from its digits; leave that to the original chain.
+        return _parse_currency_fallback(s)
+    sign, digits = m.group(2), m.group(4).replace(",", "")
+    if digits in ("", ".") or sign.count("-") + sign.count("+") > 1:
+        return 0.0
+    v = float(digits)
+    if "-" in sign:
+        v = -v
+    return -v if m.group(1) else v
+
+
+def _parse_percent(s: str) -> float:
+    m = _PERCENT_RE.fullmatch(s or "")
+    if m is None:
+        return _parse_percent_fallback(s)
+    t = m.group(1).replace(",", "")
+    if t.lstrip("+-") in ("", "."):
+        return 0.0
+    return float(t) / 100.0
 
+
+def update_summary_top_text(slide: Slide, shape: BaseShape, prs: Presentation, ctx: UpdateContext) -> None:
     owner_str = str(ctx.owner).strip() if ctx.owner else _get_investor_owners(ctx.investor)
 
     total_invested = 0.0
@@ -311,23 +341,17 @@ def update_summary_top_text(slide: Slide, shape: BaseShape, prs: Presentation, c
     if summary_tbl is None:
         print("summary_top_text: summary_table not found on this slide")
     else:
-        total_row_idx = len(summary_tbl.rows) - 1
-
-        col_total_invested = None
-        col_pct_return = None
-
-        for c in range(len(summary_tbl.columns)):
-            header = _norm_header(summary_tbl.cell(1, c).text)
-            if header == "Total\nInvested":
-                col_total_invested = c
-            elif header == "% Return":
-                col_pct_return = c
+        # Header -> column resolution is memoized on the header texts, shared with the table updaters.
+        cols = _header_columns("summary_top_text", summary_tbl)
+        col_total_invested = cols.get("total_invested")
+        col_pct_return = cols.get("pct_return")
 
         if col_total_invested is None or col_pct_return is None:
             print("summary_top_text: required columns not found in summary_table")
         else:
-            total_invested = abs(_parse_currency(summary_tbl.cell(total_row_idx, col_total_invested).text))
-            pct_return = _parse_percent(summary_tbl.cell(total_row_idx, col_pct_return).text)
+            total_cells = list(summary_tbl.rows[len(summary_tbl.rows) - 1].cells)
+            total_invested = abs(_parse_currency(total_cells[col_total_invested].text))
+            pct_return = _parse_percent(total_cells[col_pct_return].text)
 
     cumulative_income = _get_portfolio_cumulative_income(ctx)
 
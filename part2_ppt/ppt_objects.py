@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
+
+import config
 
 from pptx.presentation import Presentation
 from pptx.shapes.base import BaseShape
@@ -17,24 +19,34 @@ class UpdateContext:
     statement_thru_date_dt: datetime
     statement_thru_date_str: str
     t1_str: str
+    # (unit_type, Estimated Market Value) from General Config, read once in main().
+    market_values_by_type: Tuple[Tuple[str, float], ...] = ()
 
+# Updaters only mutate the in-memory tree; the caller saves each deck once after
+# apply_object_updates, so no updater may call prs.save().
 ObjectUpdater = Callable[[Slide, BaseShape, Presentation, UpdateContext], None]
 
-def apply_ownership_amount(ctx: UpdateContext, amount: float, key: str) -> float:
-    import config
+# Read once at import: apply_ownership_amount runs for every amount written, and the
+# exception list becomes a set lookup instead of a list scan.
+_FORCE_100_PCT = bool(getattr(config, "OWNERSHIP_FORCE_100_PCT_IN_PART2", False))
+_SCALING_EXCEPTIONS = frozenset(getattr(config, "OWNERSHIP_SCALING_EXCEPTIONS", []) or [])
 
-    if bool(getattr(config, "OWNERSHIP_FORCE_100_PCT_IN_PART2", False)):
+def apply_ownership_amount(ctx: UpdateContext, amount: float, key: str) -> float:
+    if _FORCE_100_PCT:
         return float(amount or 0.0)
 
     if ctx.ownership_pct >= 100.0:
         return float(amount or 0.0)
 
     k = str(key or "").strip()
-    if k != "" and k in getattr(config, "OWNERSHIP_SCALING_EXCEPTIONS", []):
+    if k != "" and k in _SCALING_EXCEPTIONS:
         return float(amount or 0.0)
 
     return float(amount or 0.0) * float(ctx.ownership_factor or 0.0)
 
+# Names of the shapes directly under the slide's spTree, i.e. the shapes slide.shapes yields.
+_SLIDE_SHAPE_NAMES_XPATH = "./p:cSld/p:spTree/*/*/p:cNvPr/@name"
+
 def apply_object_updates(prs: Presentation, ctx: UpdateContext) -> None:
     from ppt_object_logic import OBJECT_UPDATERS
 
@@ -47,19 +59,31 @@ def apply_object_updates(prs: Presentation, ctx: UpdateContext) -> None:
     slides_count = len(prs.slides)
     print(f"Starting object updates across {slides_count} slides. Objects: {len(shape_names)}")
 
+    # Resolve every (slide, shape, updater) target in one scan, reading each shape's name once;
+    # the update pass then only touches registered shapes.
+    object_progress = bool(getattr(config, "PRINT_OBJECT_PROGRESS", False))
+    targets = []
     for slide_idx, slide in enumerate(prs.slides, start=1):
-        if slide_idx % 5 == 0 or slide_idx == 1 or slide_idx == slides_count:
+        if object_progress and (slide_idx % 5 == 0 or slide_idx == 1 or slide_idx == slides_count):
             print(f"Scanning slide {slide_idx} of {slides_count}")
 
+        # One XPath over the slide's top-level cNvPr names; slides with no registered
+        # name skip building python-pptx shape proxies altogether.
+        if OBJECT_UPDATERS.keys().isdisjoint(slide._element.xpath(_SLIDE_SHAPE_NAMES_XPATH)):
+            continue
+
         for shape in slide.shapes:
-            if not shape.name:
-                continue
-            updater = OBJECT_UPDATERS.get(shape.name)
-            if updater is None:
+            name = shape.name
+            if not name:
                 continue
+            updater = OBJECT_UPDATERS.get(name)
+            if updater is not None:
+                targets.append((slide_idx, slide, shape, name, updater))
 
-            total_hits += 1
-            print(f"Updating object '{shape.name}' on slide {slide_idx} for investor '{ctx.investor}'")
-            updater(slide, shape, prs, ctx)
+    for slide_idx, slide, shape, name, updater in targets:
+        total_hits += 1
+        if object_progress:
+            print(f"Updating object '{name}' on slide {slide_idx} for investor '{ctx.investor}'")
+        updater(slide, shape, prs, ctx)
 
-    print(f"Completed object updates. Objects updated: {total_hits}")
+    print(f"Completed object updates. Objects updated: {total_hits} across {slides_count} slides")
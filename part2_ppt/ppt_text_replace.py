@@ -1,14 +1,38 @@
 from __future__ import annotations
 
-from typing import Dict
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Pattern, Tuple
 
 from pptx.shapes.base import BaseShape
 
 
+@lru_cache(maxsize=64)
+def _token_pattern_cached(tokens: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    # Longest first so a token that is a prefix of another never shadows it.
+    keys = sorted((t for t in tokens if t), key=len, reverse=True)
+    if not keys:
+        return None
+    return re.compile("|".join(re.escape(k) for k in keys))
+
+
+def token_pattern(token_map: Dict[str, str]) -> Optional[Pattern[str]]:
+    # One alternation per token set: each text is scanned once instead of once per token.
+    # Keyed on the tokens only; values are looked up from token_map at substitution time.
+    return _token_pattern_cached(tuple(token_map))
+
+
 def replace_tokens_in_shape(shape: BaseShape, token_map: Dict[str, str]) -> int:
     if not hasattr(shape, "text_frame"):
         return 0
 
+    pat = token_pattern(token_map)
+    if pat is None:
+        return 0
+
+    def _sub(m: "re.Match[str]") -> str:
+        return token_map[m.group(0)]
+
     tf = shape.text_frame
     replacements = 0
 
@@ -16,10 +40,7 @@ def replace_tokens_in_shape(shape: BaseShape, token_map: Dict[str, str]) -> int:
         for run in paragraph.runs:
             if run.text is None:
                 continue
-            new_text = run.text
-            for token, value in token_map.items():
-                if token in new_text:
-                    new_text = new_text.replace(token, value)
+            new_text = pat.sub(_sub, run.text)
             if new_text != run.text:
                 run.text = new_text
                 replacements += 1
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+for p in (str(_ROOT_DIR / "common"), str(_ROOT_DIR / "part2_ppt")):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches
+
+from ppt_object_logic_tables import _set_cell_text_preserve_cell_format
+
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_A = f'xmlns:a="{_A_NS}"'
+
+_END_PARA = (
+    '<a:endParaRPr lang="en-US" sz="1000" b="0">'
+    '<a:solidFill><a:srgbClr val="333333"/></a:solidFill><a:latin typeface="Lato"/>'
+    "</a:endParaRPr>"
+)
+# A run typed in PowerPoint with its own formatting, different from the cell's endParaRPr.
+_TYPED_RUN = (
+    '<a:r><a:rPr lang="en-US" sz="1400" b="1">'
+    '<a:solidFill><a:srgbClr val="00FF00"/></a:solidFill><a:latin typeface="Arial"/>'
+    "</a:rPr><a:t>$0</a:t></a:r>"
+)
+
+
+def _cell_with_paragraph(p_xml: str):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    cell = slide.shapes.add_table(1, 1, 0, 0, Inches(2), Inches(1)).table.cell(0, 0)
+    txBody = cell._tc.txBody
+    for p in txBody.findall(f"{{{_A_NS}}}p"):
+        txBody.remove(p)
+    txBody.append(etree.fromstring(f"<a:p {_A}>{p_xml}</a:p>"))
+    return cell
+
+
+def _first_run_style(cell):
+    run = cell.text_frame.paragraphs[0].runs[0]
+    font = run.font
+    return (run.text, font.name, font.size, font.bold, str(font.color.rgb), cell.text_frame.paragraphs[0].alignment)
+
+
+class TypedRunTemplateTests(unittest.TestCase):
+    def test_typed_run_is_restyled_from_end_para(self) -> None:
+        typed = _cell_with_paragraph('<a:pPr algn="r"/>' + _TYPED_RUN + _END_PARA)
+        placeholder = _cell_with_paragraph('<a:pPr algn="r"/>' + _END_PARA)
+
+        _set_cell_text_preserve_cell_format(typed, "$1,234")
+        _set_cell_text_preserve_cell_format(placeholder, "$1,234")
+
+        self.assertEqual(_first_run_style(typed), _first_run_style(placeholder))
+        self.assertEqual(_first_run_style(typed)[1:5], ("Lato", 127000, False, "333333"))
+
+    def test_typed_run_negative_is_red_with_end_para_font(self) -> None:
+        typed = _cell_with_paragraph(_TYPED_RUN + _END_PARA)
+        _set_cell_text_preserve_cell_format(typed, "($5)", "FF0000")
+        self.assertEqual(_first_run_style(typed)[:5], ("($5)", "Lato", 127000, False, "FF0000"))
+
+    def test_typed_run_already_holding_the_text_is_still_restyled(self) -> None:
+        typed = _cell_with_paragraph(_TYPED_RUN + _END_PARA)
+        _set_cell_text_preserve_cell_format(typed, "$0")
+        self.assertEqual(_first_run_style(typed)[:5], ("$0", "Lato", 127000, False, "333333"))
+
+    def test_run_matching_end_para_style_is_written_in_place(self) -> None:
+        matching_run = (
+            '<a:r><a:rPr lang="en-US" sz="1000" b="0">'
+            '<a:solidFill><a:srgbClr val="333333"/></a:solidFill><a:latin typeface="Lato"/>'
+            "</a:rPr><a:t>$0</a:t></a:r>"
+        )
+        cell = _cell_with_paragraph(matching_run + _END_PARA)
+        run_before = cell._tc.txBody.find(f"{{{_A_NS}}}p/{{{_A_NS}}}r")
+
+        _set_cell_text_preserve_cell_format(cell, "$42")
+
+        self.assertIs(cell._tc.txBody.find(f"{{{_A_NS}}}p/{{{_A_NS}}}r"), run_before)
+        self.assertEqual(_first_run_style(cell)[:5], ("$42", "Lato", 127000, False, "333333"))
+
+    def test_red_run_is_rewritten_in_place_and_stays_red(self) -> None:
+        red_run = (
+            '<a:r><a:rPr lang="en-US" sz="1000" b="0">'
+            '<a:solidFill><a:srgbClr val="FF0000"/></a:solidFill><a:latin typeface="Lato"/>'
+            "</a:rPr><a:t>($5)</a:t></a:r>"
+        )
+        cell = _cell_with_paragraph(red_run + _END_PARA)
+        run_before = cell._tc.txBody.find(f"{{{_A_NS}}}p/{{{_A_NS}}}r")
+
+        _set_cell_text_preserve_cell_format(cell, "($7)", "FF0000")
+
+        self.assertIs(cell._tc.txBody.find(f"{{{_A_NS}}}p/{{{_A_NS}}}r"), run_before)
+        self.assertEqual(_first_run_style(cell)[:5], ("($7)", "Lato", 127000, False, "FF0000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+import sys
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+for p in (str(_ROOT_DIR / "common"), str(_ROOT_DIR / "part2_ppt")):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from openpyxl import Workbook
+
+import config
+from excel_inputs import (
+    _read_setup_sheets,
+    load_general_config,
+    load_general_config_market_values,
+    load_run_config_rows,
+)
+
+
+def _write_stale_dimension_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = config.GENERAL_CONFIG_SHEET
+    ws.append([config.GENERAL_CONFIG_LABEL_OUTPUT_LOCATION, "C:/out"])
+    ws.append([config.GENERAL_CONFIG_LABEL_STATEMENT_THRU_DATE, datetime(2025, 12, 31)])
+    ws.append(["Studio Market:", 100000])
+    ws.append(["2-Bed Market:", "n/a"])
+    ws.append(["1-Bed Market:", 150000.5])
+
+    runs = wb.create_sheet(config.RUN_CONFIG_SHEET)
+    runs.append(["Investor", "Owner", "Base Template"])
+    runs.append(["Inv1", "OwnA", "std.pptx"])
+    runs.append(["Inv2", "OwnB", ""])
+
+    tmp = path.with_suffix(".tmp.xlsx")
+    wb.save(tmp)
+
+    # Rewrite every sheet's <dimension> to "A1", as some writers leave it.
+    with zipfile.ZipFile(tmp) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename.startswith("xl/worksheets/sheet"):
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+            dst.writestr(item, data)
+    tmp.unlink()
+
+
+class StaleDimensionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _read_setup_sheets.cache_clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.xlsx = Path(self._tmp.name) / "setup.xlsx"
+        _write_stale_dimension_workbook(self.xlsx)
+
+    def tearDown(self) -> None:
+        _read_setup_sheets.cache_clear()
+        self._tmp.cleanup()
+
+    def test_general_config_reads_past_stale_dimension(self) -> None:
+        general = load_general_config(
+            xlsx_path=self.xlsx,
+            sheet_name=config.GENERAL_CONFIG_SHEET,
+            label_output_location=config.GENERAL_CONFIG_LABEL_OUTPUT_LOCATION,
+            label_statement_thru=config.GENERAL_CONFIG_LABEL_STATEMENT_THRU_DATE,
+        )
+        self.assertEqual(general.output_location, Path("C:/out"))
+        self.assertEqual(general.statement_thru_date, datetime(2025, 12, 31))
+
+    def test_market_values_in_label_order(self) -> None:
+        values = load_general_config_market_values(self.xlsx, config.GENERAL_CONFIG_SHEET)
+        self.assertEqual(values, (("Studio", 100000.0), ("1-Bed", 150000.5), ("2-Bed", 0.0), ("3-Bed", 0.0)))
+
+    def test_run_config_reads_every_row(self) -> None:
+        rows = load_run_config_rows(xlsx_path=self.xlsx, sheet_name=config.RUN_CONFIG_SHEET)
+        self.assertEqual(
+            [(r.investor, r.owner, r.standard_slides_template) for r in rows],
+            [("Inv1", "OwnA", "std.pptx"), ("Inv2", "OwnB", "")],
+        )
+
+
+class MarketValueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _read_setup_sheets.cache_clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.xlsx = Path(self._tmp.name) / "setup.xlsx"
+
+    def tearDown(self) -> None:
+        _read_setup_sheets.cache_clear()
+        self._tmp.cleanup()
+
+    def test_repeated_label_takes_last_value(self) -> None:
+        wb = Workbook()
+        ws = wb.active
+        ws.title = config.GENERAL_CONFIG_SHEET
+        for label, value in (
+            ("Studio Market:", 100000),
+            ("1-Bed Market:", 150000),
+            ("2-Bed Market:", 200000),
+            ("3-Bed Market:", 250000),
+            ("Studio Market:", 110000),
+        ):
+            ws.append([label, value])
+        wb.save(self.xlsx)
+
+        values = load_general_config_market_values(self.xlsx, config.GENERAL_CONFIG_SHEET)
+        self.assertEqual(values, (("Studio", 110000.0), ("1-Bed", 150000.0), ("2-Bed", 200000.0), ("3-Bed", 250000.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
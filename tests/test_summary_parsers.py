@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+for p in (str(_ROOT_DIR / "common"), str(_ROOT_DIR / "part2_ppt")):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from ppt_object_logic_text import _parse_currency, _parse_percent
+
+
+class SummaryParserTests(unittest.TestCase):
+    def test_writer_formats(self) -> None:
+        self.assertEqual(_parse_currency("$1,234"), 1234.0)
+        self.assertEqual(_parse_currency("($1,234)"), -1234.0)
+        self.assertEqual(_parse_currency("-$1,234"), -1234.0)
+        self.assertEqual(_parse_currency("-"), 0.0)
+        self.assertEqual(_parse_currency(""), 0.0)
+        self.assertAlmostEqual(_parse_percent("12.3%"), 0.123)
+        self.assertEqual(_parse_percent("-"), 0.0)
+
+    def test_hand_edited_cells_parse_as_before(self) -> None:
+        self.assertEqual(_parse_currency("$ -1,234"), -1234.0)
+        self.assertEqual(_parse_currency("1e3"), 1000.0)
+        self.assertEqual(_parse_currency("1_000"), 1000.0)
+        self.assertEqual(_parse_currency("-$ 3"), 0.0)
+        self.assertAlmostEqual(_parse_percent("% 12"), 0.12)
+        self.assertAlmostEqual(_parse_percent("1e1%"), 0.1)
+        self.assertAlmostEqual(_parse_percent("12.3%%"), 0.123)
+
+
+if __name__ == "__main__":
+    unittest.main()